@@ -1,15 +1,40 @@
 from fastapi import FastAPI, UploadFile, File, Form, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from typing import List
 import re
+
+# PyMuPDF is ~10x faster than PyPDF2 for text extraction; fall back to
+# PyPDF2 if it is not installed.
+try:
+    import fitz  # PyMuPDF
+except ImportError:
+    fitz = None
+
+# numpy vectorizes the substring fallback in filter_for_swimmer; the
+# pure-Python scan is kept for environments without it.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# uvloop (bundled with uvicorn[standard] on Linux) roughly doubles event
+# loop throughput; unavailable on Windows dev machines, so guarded.
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 from PyPDF2 import PdfReader
 from io import BytesIO
-import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import os
 from datetime import datetime
-import json
+import asyncio
+import hashlib
+import threading
+from collections import OrderedDict, defaultdict
+from operator import itemgetter
 
 # PDF generation
 from reportlab.lib.pagesizes import landscape, letter
@@ -17,7 +42,15 @@ from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, Tabl
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib import colors
 
-app = FastAPI()
+# Already a hard dependency via ORJSONResponse; also used for parsing
+# the form-posted results payload.
+import orjson
+
+if uvloop is not None:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+# orjson serializes the large /extract and /list-swimmers payloads in C.
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # --------------- SECURITY / CONFIG ---------------
 ALLOWED_ORIGINS = [
@@ -27,14 +60,16 @@ ALLOWED_ORIGINS = [
 ]
 
 MAX_UPLOAD_SIZE = 10 * 1024 * 1024  # 10 MB
+ALLOWED_UPLOAD_TYPES = ("application/pdf", "application/x-pdf", "application/octet-stream")
 PARENT_PIN = "lssc2025"
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type"],
+    max_age=86400,  # let browsers cache the preflight for 24h
 )
 
 # --------------- STATIC FILES ---------------
@@ -44,13 +79,25 @@ os.makedirs(STATIC_DIR, exist_ok=True)
 app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
 
 
+# index.html is read once at startup so GET / serves straight from
+# memory instead of hitting the filesystem on every request.
+_INDEX_HTML = None
+
+
+@app.on_event("startup")
+def load_index_html():
+    global _INDEX_HTML
+    index_path = os.path.join(STATIC_DIR, "index.html")
+    if os.path.exists(index_path):
+        with open(index_path, "r", encoding="utf-8") as f:
+            _INDEX_HTML = f.read()
+
+
 @app.get("/", response_class=HTMLResponse)
 def read_root():
-    index_path = os.path.join(STATIC_DIR, "index.html")
-    if not os.path.exists(index_path):
+    if _INDEX_HTML is None:
         return HTMLResponse("<h1>Lakeshore Swim App</h1><p>static/index.html not found.</p>")
-    with open(index_path, "r", encoding="utf-8") as f:
-        return HTMLResponse(f.read())
+    return HTMLResponse(_INDEX_HTML)
 
 
 # --------------- AUTH (PIN) ---------------
@@ -65,10 +112,9 @@ def auth(pin: str = Form(...)):
 
 @app.post("/list-swimmers")
 async def list_swimmers(file: UploadFile = File(...)):
-    content_bytes = await secure_read_upload(file)
-    text = extract_text_from_upload(file.content_type, content_bytes)
-    events = parse_heat_sheet(text)
-    swimmers = get_unique_swimmers(events)
+    content_bytes, digest = await secure_read_upload(file)
+    parsed = await asyncio.to_thread(get_parsed_events, file.content_type, content_bytes, digest)
+    swimmers = parsed["unique_swimmers"]
     return {"count": len(swimmers), "swimmers": swimmers}
 
 
@@ -77,11 +123,10 @@ async def extract_swimmer_events(
     swimmer_name: str = Form(...),
     file: UploadFile = File(...)
 ):
-    content_bytes = await secure_read_upload(file)
-    text = extract_text_from_upload(file.content_type, content_bytes)
-    events = parse_heat_sheet(text)
-    events = sorted(events, key=lambda e: e["event_number"])
-    matched = filter_for_swimmer(events, swimmer_name)
+    content_bytes, digest = await secure_read_upload(file)
+    matched = await asyncio.to_thread(
+        extract_matched_events, file.content_type, content_bytes, digest, swimmer_name
+    )
     return {
         "swimmer": swimmer_name,
         "count": len(matched),
@@ -94,17 +139,16 @@ async def generate_swimmer_pdf(
     swimmer_name: str = Form(...),
     file: UploadFile = File(...)
 ):
-    content_bytes = await secure_read_upload(file)
-    text = extract_text_from_upload(file.content_type, content_bytes)
-    events = parse_heat_sheet(text)
-    events = sorted(events, key=lambda e: e["event_number"])
-    matched = filter_for_swimmer(events, swimmer_name)
-
-    tmp_path = build_schedule_pdf(swimmer_name, matched)
-    return FileResponse(
-        tmp_path,
+    content_bytes, digest = await secure_read_upload(file)
+    matched = await asyncio.to_thread(
+        extract_matched_events, file.content_type, content_bytes, digest, swimmer_name
+    )
+    buf = await asyncio.to_thread(build_schedule_pdf, swimmer_name, matched)
+    filename = f"{swimmer_name.replace(' ', '_')}_schedule.pdf"
+    return StreamingResponse(
+        buf,
         media_type="application/pdf",
-        filename=f"{swimmer_name.replace(' ', '_')}_schedule.pdf",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
     )
 
 
@@ -130,271 +174,452 @@ async def generate_results_pdf(
     ]
     """
     try:
-        results = json.loads(results_json)
+        results = orjson.loads(results_json)
     except Exception:
         raise HTTPException(status_code=400, detail="Bad results data")
 
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    tmp_path = tmp.name
-    tmp.close()
+    # reportlab rendering is CPU-bound; keep it off the event loop like
+    # the other PDF endpoint.
+    buf = await asyncio.to_thread(build_results_pdf, swimmer_name, results)
+    filename = f"{swimmer_name.replace(' ', '_')}_results.pdf"
+    return StreamingResponse(
+        buf,
+        media_type="application/pdf",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
 
-    doc = SimpleDocTemplate(
-        tmp_path,
+def _results_row(ev: dict) -> list:
+    seed = ev.get("seed_time") or ""
+    final = ev.get("final_time") or ""
+    delta = ""
+    if seed and final:
+        delta_seconds = time_to_seconds(final) - time_to_seconds(seed)
+        delta = f"{delta_seconds:+.2f}s"
+    if ev.get("total_heats"):
+        heat_display = f"{ev.get('heat')} of {ev.get('total_heats')}"
+    else:
+        heat_display = str(ev.get("heat") or "")
+    return [
+        f"#{ev.get('event_number')} – {ev.get('event_name','')}",
+        heat_display,
+        ev.get("lane") or "",
+        seed,
+        final,
+        delta,
+    ]
+
+
+def _make_doc(buf: BytesIO) -> SimpleDocTemplate:
+    """Shared page setup for both PDF builders."""
+    return SimpleDocTemplate(
+        buf,
         pagesize=landscape(letter),
         leftMargin=30,
         rightMargin=30,
         topMargin=30,
         bottomMargin=30,
     )
-    elements = []
 
-    title_style = ParagraphStyle("title", fontSize=16, spaceAfter=6, leading=18)
-    sub_style = ParagraphStyle("sub", fontSize=9, spaceAfter=4, textColor=colors.grey)
 
-    elements.append(Paragraph(f"SwimDay Simplified – Results for {swimmer_name}", title_style))
-    elements.append(Paragraph("Lakeshore Swim Club", sub_style))
+def build_results_pdf(swimmer_name: str, results: List[dict]) -> BytesIO:
+    buf = BytesIO()
+    doc = _make_doc(buf)
+    elements = []
+
+    elements.append(Paragraph(f"SwimDay Simplified – Results for {swimmer_name}", _TITLE_STYLE))
+    elements.append(Paragraph("Lakeshore Swim Club", _SUB_STYLE))
     elements.append(
-        Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y %I:%M %p')}", sub_style)
+        Paragraph(f"Generated: {datetime.now().strftime('%B %d, %Y %I:%M %p')}", _SUB_STYLE)
     )
     elements.append(Spacer(1, 12))
 
     data = [["Event", "Heat", "Lane", "Seed", "Final", "Δ (Final - Seed)"]]
-
-    for ev in results:
-        seed = ev.get("seed_time") or ""
-        final = ev.get("final_time") or ""
-        delta = ""
-        if seed and final:
-            delta_seconds = time_to_seconds(final) - time_to_seconds(seed)
-            delta = f"{delta_seconds:+.2f}s"
-        heat_display = ""
-        if ev.get("total_heats"):
-            heat_display = f"{ev.get('heat')} of {ev.get('total_heats')}"
-        else:
-            heat_display = str(ev.get("heat") or "")
-        data.append(
-            [
-                f"#{ev.get('event_number')} – {ev.get('event_name','')}",
-                heat_display,
-                ev.get("lane") or "",
-                seed,
-                final,
-                delta,
-            ]
-        )
+    data.extend(_results_row(ev) for ev in results)
 
     table = Table(
         data,
         colWidths=[240, 70, 50, 60, 70, 90],
     )
-    table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#007bff")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, 0), 10),
-                ("ALIGN", (1, 1), (-1, -1), "CENTER"),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("GRID", (0, 0), (-1, -1), 0.4, colors.grey),
-                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
-                ("LEFTPADDING", (0, 0), (-1, -1), 4),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-            ]
-        )
-    )
+    table.setStyle(_RESULTS_TABLE_STYLE)
 
     elements.append(table)
     doc.build(elements)
-
-    return FileResponse(
-        tmp_path,
-        media_type="application/pdf",
-        filename=f"{swimmer_name.replace(' ', '_')}_results.pdf",
-    )
+    buf.seek(0)
+    return buf
 
 
 # --------------- HELPERS ---------------
 
-async def secure_read_upload(file: UploadFile) -> bytes:
-    content = await file.read()
-    if len(content) > MAX_UPLOAD_SIZE:
-        raise HTTPException(status_code=413, detail="File too large. Max 10 MB.")
-    return content
+# reportlab styles are surprisingly expensive to construct; build the
+# shared ones once instead of per request (and per row for _EV_STYLE).
+_TITLE_STYLE = ParagraphStyle("title", fontSize=16, spaceAfter=6, leading=18)
+_SUB_STYLE = ParagraphStyle("sub", fontSize=9, spaceAfter=4, textColor=colors.grey)
+_LABEL_STYLE = ParagraphStyle("label", fontSize=9, spaceAfter=2)
+_EV_STYLE = ParagraphStyle("ev", fontSize=9, leading=11)
+
+# TableStyles are plain command lists and safe to share across builds.
+_RESULTS_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#007bff")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 10),
+        ("ALIGN", (1, 1), (-1, -1), "CENTER"),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("GRID", (0, 0), (-1, -1), 0.4, colors.grey),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
+        ("LEFTPADDING", (0, 0), (-1, -1), 4),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+    ]
+)
+_SCHEDULE_TABLE_STYLE = TableStyle(
+    [
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#007bff")),
+        ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, 0), 10),
+        ("FONTSIZE", (0, 1), (0, -1), 9),  # match _EV_STYLE for plain cells
+        ("ALIGN", (1, 1), (3, -1), "CENTER"),
+        ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
+        ("GRID", (0, 0), (-1, -1), 0.4, colors.grey),
+        ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
+        ("LEFTPADDING", (0, 0), (-1, -1), 4),
+        ("RIGHTPADDING", (0, 0), (-1, -1), 4),
+        ("TOPPADDING", (0, 0), (-1, -1), 4),
+        ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
+    ]
+)
+
+# Parsed heat sheets keyed by content digest. The usual flow uploads the
+# same PDF to /list-swimmers, /extract and /generate-pdf in sequence, so
+# caching the parse saves the PDF extraction on all but the first call.
+PARSE_CACHE_MAX = 32
+_parse_cache: "OrderedDict[bytes, dict]" = OrderedDict()
+_parse_cache_lock = threading.Lock()
 
 
-def extract_text_from_upload(content_type: str, content_bytes: bytes) -> str:
+def get_parsed_events(content_type: str, content_bytes: bytes, key: bytes = None) -> dict:
+    if key is None:
+        key = hashlib.blake2b(content_bytes, digest_size=16).digest()
+    with _parse_cache_lock:
+        if key in _parse_cache:
+            _parse_cache.move_to_end(key)
+            return _parse_cache[key]
+    parsed = parse_heat_sheet(iter_upload_page_texts(content_type, content_bytes))
+    with _parse_cache_lock:
+        _parse_cache[key] = parsed
+        while len(_parse_cache) > PARSE_CACHE_MAX:
+            _parse_cache.popitem(last=False)
+    return parsed
+
+
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MB
+
+
+def extract_matched_events(content_type: str, content_bytes: bytes, key: bytes, swimmer_name: str) -> List[dict]:
+    """Sync body shared by /extract and /generate-pdf, run off the event
+    loop via asyncio.to_thread so parsing never blocks other requests."""
+    parsed = get_parsed_events(content_type, content_bytes, key)
+    matched = filter_for_swimmer(parsed, swimmer_name)
+    matched.sort(key=itemgetter("event_number"))
+    return matched
+
+
+async def secure_read_upload(file: UploadFile):
+    """
+    Read the upload in chunks so oversize files are rejected as soon as
+    the limit is crossed, and hash incrementally while reading so the
+    parse cache key comes for free. Returns (content_bytes, digest).
+
+    The content-type check happens before any bytes are read, and the
+    %PDF magic number is verified afterwards so malformed files never
+    reach the PDF parser's slow recovery paths.
+    """
+    if file.content_type not in ALLOWED_UPLOAD_TYPES:
+        raise HTTPException(status_code=400, detail="Only PDF heat sheets are supported.")
+    hasher = hashlib.blake2b(digest_size=16)
+    buf = BytesIO()
+    total = 0
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        total += len(chunk)
+        if total > MAX_UPLOAD_SIZE:
+            raise HTTPException(status_code=413, detail="File too large. Max 10 MB.")
+        hasher.update(chunk)
+        buf.write(chunk)
+    content = buf.getvalue()
+    if not content.startswith(b"%PDF"):
+        raise HTTPException(status_code=400, detail="Not a valid PDF.")
+    return content, hasher.digest()
+
+
+# Below this page count, thread-pool overhead outweighs the win.
+MIN_PAGES_FOR_PARALLEL = 8
+
+
+def _extract_page_range(content_bytes: bytes, start: int, stop: int) -> str:
+    # Each worker opens its own document: fitz documents are not safe to
+    # share across threads, but extraction itself releases the GIL.
+    with fitz.open(stream=content_bytes, filetype="pdf") as doc:
+        return "\n".join(doc.load_page(i).get_text("text") for i in range(start, stop))
+
+
+def iter_upload_page_texts(content_type: str, content_bytes: bytes):
+    """
+    Yield extracted text one page (or page batch) at a time so the
+    parser can consume the document incrementally instead of holding
+    the full concatenated text in memory.
+    """
     if content_bytes is None:
         raise HTTPException(status_code=400, detail="Empty file.")
-    if content_type not in ("application/pdf", "application/x-pdf", "application/octet-stream"):
+    if content_type not in ALLOWED_UPLOAD_TYPES:
         raise HTTPException(status_code=400, detail="Only PDF heat sheets are supported.")
+    if fitz is not None:
+        try:
+            doc = fitz.open(stream=content_bytes, filetype="pdf")
+        except Exception:
+            raise HTTPException(status_code=400, detail="Could not read PDF. Please upload a standard PDF heat sheet.")
+        page_count = doc.page_count
+        if page_count < MIN_PAGES_FOR_PARALLEL:
+            with doc:
+                for page in doc:
+                    yield page.get_text("text")
+            return
+        doc.close()
+        workers = min(8, os.cpu_count() or 1)
+        batch = -(-page_count // workers)  # ceil division
+        ranges = [(i, min(i + batch, page_count)) for i in range(0, page_count, batch)]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(lambda r: _extract_page_range(content_bytes, *r), ranges)
+        return
     try:
-        pdf_stream = BytesIO(content_bytes)
-        reader = PdfReader(pdf_stream)
-        pages_text = []
-        for page in reader.pages:
-            pages_text.append(page.extract_text() or "")
-        return "\n".join(pages_text)
+        reader = PdfReader(BytesIO(content_bytes))
+        pages = list(reader.pages)
     except Exception:
         raise HTTPException(status_code=400, detail="Could not read PDF. Please upload a standard PDF heat sheet.")
+    for page in pages:
+        try:
+            yield page.extract_text() or ""
+        except Exception:
+            raise HTTPException(status_code=400, detail="Could not read PDF. Please upload a standard PDF heat sheet.")
+
+
+def extract_text_from_upload(content_type: str, content_bytes: bytes) -> str:
+    return "\n".join(iter_upload_page_texts(content_type, content_bytes))
+
+
+# Note on the regex engine: google-re2 was evaluated here for its
+# linear-time guarantees, but the patterns below rely on lookbehind
+# ((?<!\n)) and capturing lookaheads, neither of which RE2 supports.
+# The alternations are simple enough that stdlib re cannot backtrack
+# catastrophically on them, so we stay on re.
+
+# Single alternation covering all four former preprocess passes so the
+# text is rewritten in one scan instead of four full-buffer re.sub calls.
+_PREPROCESS_RE = re.compile(
+    r"Heat\s+(\d+)\s+of\s+(\d+)\s+\(#(\d+)\s+([^)]+)\)"
+    r"|Heat\s+(\d+)\s+\(#(\d+)\s+([^)]+)\)"
+    r"|(?<!\n)(#\d+\s+)"
+    r"|(?<!\n)(Heat\s+\d+)"
+)
+
+
+def _preprocess_replacement(m: "re.Match") -> str:
+    if m.group(1):
+        rewritten = f"#{m.group(3)} {m.group(4)}\nHeat {m.group(1)} of {m.group(2)}"
+    elif m.group(5):
+        rewritten = f"#{m.group(6)} {m.group(7)}\nHeat {m.group(5)}"
+    else:
+        return "\n" + (m.group(8) or m.group(9))
+    if m.start() == 0 or m.string[m.start() - 1] != "\n":
+        rewritten = "\n" + rewritten
+    return rewritten
 
 
 def preprocess_text(text: str) -> str:
-    text = re.sub(
-        r"Heat\s+(\d+)\s+of\s+(\d+)\s+\(#(\d+)\s+([^)]+)\)",
-        r"#\3 \4\nHeat \1 of \2",
-        text,
-    )
-    text = re.sub(
-        r"Heat\s+(\d+)\s+\(#(\d+)\s+([^)]+)\)",
-        r"#\2 \3\nHeat \1",
-        text,
-    )
-    text = re.sub(r"(?<!\n)(#\d+\s+)", r"\n\1", text)
-    text = re.sub(r"(?<!\n)(Heat\s+\d+)", r"\n\1", text)
-    return text
+    return _PREPROCESS_RE.sub(_preprocess_replacement, text)
+
+
+# One alternation over the whole preprocessed text replaces the old
+# per-line loop (split + strip + up to three match attempts per line).
+_LINE_RE = re.compile(
+    r"^[ \t]*(?:"
+    r"#(?P<ev>\d+)[ \t]+(?P<evn>[^\r\n]*?)[ \t\r]*$"
+    r"|Heat[ \t]+(?P<ho>\d+)[ \t]+of[ \t]+(?P<tot>\d+)"
+    r"|Heat[ \t]+(?P<h>\d+)\b"
+    r"|(?P<sw>[^\r\n]*?[A-Za-z'\-]+,[ \t]+[A-Za-z'\-]+[^\r\n]*?)[ \t\r]*$"
+    r")",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Name, seed time and lane pulled from a swimmer row in one search. The
+# seed/lane captures live in lookaheads so they can overlap (a row that
+# ends in a time still reports its trailing digits as the lane, matching
+# the old separate extractors).
+_SWIMMER_RE = re.compile(
+    r"(?P<name>[A-Za-z'\-]+,\s+[A-Za-z'\-]+(?:\s+[A-Za-z.]+)?)"
+    r"(?:(?=.*?(?P<seed>\d+:\d+\.\d+|\d+\.\d+)))?"
+    r"(?:(?=.*?(?P<lane>\d+)\s*$))?"
+)
+
+
+# Column order for the struct-of-arrays event storage below.
+_EVENT_FIELDS = (
+    "event_number",
+    "event_name",
+    "heat",
+    "total_heats",
+    "lane",
+    "seed_time",
+    "raw_line",
+    "swimmer_name",
+)
 
 
-def parse_heat_sheet(text: str):
-    text = preprocess_text(text)
-    lines = text.splitlines()
-    events: List[dict] = []
+def _lower_names_array(names: List[str]):
+    lowered = [n.lower() for n in names]
+    if np is not None:
+        return np.array(lowered, dtype=str)
+    return lowered
+
+
+def event_at(columns: dict, i: int) -> dict:
+    """Materialize one event dict from the parallel column lists."""
+    return {field: columns[field][i] for field in _EVENT_FIELDS}
+
+
+def parse_heat_sheet(text) -> dict:
+    """
+    Parse heat-sheet text into the columnar event structure. Accepts a
+    single string or an iterable of per-page text chunks; parser state
+    (current event/heat) carries across chunk boundaries.
+    """
+    chunks = (text,) if isinstance(text, str) else text
+    # Parallel column lists instead of one dict per event: far less
+    # per-row memory and faster to scan; dicts are rebuilt only for the
+    # rows that actually leave the API (see event_at).
+    columns: dict = {field: [] for field in _EVENT_FIELDS}
+    unique_swimmers = set()
+    name_index = defaultdict(list)
 
     current_event_number = None
     current_event_name = None
     current_heat = None
     current_total_heats = None
 
-    event_header_re = re.compile(r"^#(\d+)\s+(.*)")
-    heat_of_re = re.compile(r"^Heat\s+(\d+)\s+of\s+(\d+)", re.IGNORECASE)
-    heat_only_re = re.compile(r"^Heat\s+(\d+)\b", re.IGNORECASE)
-
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        m_ev = event_header_re.match(line)
-        if m_ev:
-            current_event_number = int(m_ev.group(1))
-            current_event_name = m_ev.group(2).strip().rstrip(")")
-            current_heat = None
-            continue
-
-        m_heat = heat_of_re.match(line)
-        if m_heat:
-            current_heat = int(m_heat.group(1))
-            current_total_heats = int(m_heat.group(2))
-            continue
-
-        m_heat2 = heat_only_re.match(line)
-        if m_heat2:
-            current_heat = int(m_heat2.group(1))
-            continue
-
-        if current_event_number is not None and current_heat is not None:
-            name = extract_name(line)
-            if name:
-                events.append(
-                    {
-                        "event_number": current_event_number,
-                        "event_name": current_event_name,
-                        "heat": current_heat,
-                        "total_heats": current_total_heats,
-                        "lane": extract_lane(line),
-                        "seed_time": extract_seed_time(line),
-                        "raw_line": line,
-                        "swimmer_name": name,
-                    }
-                )
-
-    return events
-
-
-def extract_lane(line: str):
-    m = re.search(r"(\d+)\s*$", line)
-    if m:
-        return int(m.group(1))
-    return None
-
-
-def extract_seed_time(line: str):
-    m = re.search(r"(\d+:\d+\.\d+|\d+\.\d+)", line)
-    if m:
-        return m.group(1)
-    return None
-
-
-def extract_name(line: str):
-    m = re.search(r"([A-Za-z'\-]+,\s+[A-Za-z'\-]+(?:\s+[A-Za-z.]+)?)", line)
-    if m:
-        return m.group(1).strip()
-    return None
-
-
-def filter_for_swimmer(events: List[dict], swimmer_name: str):
+    col_event_number = columns["event_number"]
+    col_event_name = columns["event_name"]
+    col_heat = columns["heat"]
+    col_total_heats = columns["total_heats"]
+    col_lane = columns["lane"]
+    col_seed_time = columns["seed_time"]
+    col_raw_line = columns["raw_line"]
+    col_swimmer_name = columns["swimmer_name"]
+
+    for chunk in chunks:
+        for m in _LINE_RE.finditer(preprocess_text(chunk)):
+            if m.group("ev") is not None:
+                current_event_number = int(m.group("ev"))
+                current_event_name = m.group("evn").strip().rstrip(")")
+                current_heat = None
+                continue
+
+            if m.group("ho") is not None:
+                current_heat = int(m.group("ho"))
+                current_total_heats = int(m.group("tot"))
+                continue
+
+            if m.group("h") is not None:
+                current_heat = int(m.group("h"))
+                continue
+
+            if current_event_number is not None and current_heat is not None:
+                line = m.group("sw")
+                sm = _SWIMMER_RE.search(line)
+                if sm:
+                    name = sm.group("name")
+                    lane = sm.group("lane")
+                    name_index[name.lower()].append(len(col_event_number))
+                    col_event_number.append(current_event_number)
+                    col_event_name.append(current_event_name)
+                    col_heat.append(current_heat)
+                    col_total_heats.append(current_total_heats)
+                    col_lane.append(int(lane) if lane else None)
+                    col_seed_time.append(sm.group("seed"))
+                    col_raw_line.append(line)
+                    col_swimmer_name.append(name)
+                    unique_swimmers.add(name)
+
+    return {
+        "columns": columns,
+        "count": len(col_event_number),
+        "unique_swimmers": sorted(unique_swimmers, key=str.lower),
+        "name_index": dict(name_index),
+        "swimmer_names_lower": _lower_names_array(col_swimmer_name),
+    }
+
+
+def filter_for_swimmer(parsed: dict, swimmer_name: str):
     target = swimmer_name.lower().strip()
-    return [
-        ev for ev in events
-        if ev.get("swimmer_name") and target in ev["swimmer_name"].lower()
-    ]
+    columns = parsed["columns"]
+    name_index = parsed["name_index"]
+    # Exact lookup first (the UI sends names straight from the dropdown),
+    # vectorized substring scan over the lowercased names as a fallback.
+    if target in name_index:
+        return [event_at(columns, i) for i in name_index[target]]
+    lowered = parsed["swimmer_names_lower"]
+    if np is not None and len(lowered):
+        mask = np.char.find(lowered, target) >= 0
+        idxs = np.nonzero(mask)[0]
+    else:
+        idxs = [i for i, name in enumerate(lowered) if target in name]
+    return [event_at(columns, int(i)) for i in idxs]
 
 
-def get_unique_swimmers(events: List[dict]) -> List[str]:
-    names = set()
-    for ev in events:
-        if ev.get("swimmer_name"):
-            names.add(ev["swimmer_name"])
-    return sorted(names, key=lambda x: x.lower())
+# Event names shorter than this fit the 240pt column without wrapping,
+# so they can skip the (expensive) Paragraph flowable entirely.
+_EVENT_CELL_WRAP_LEN = 50
 
 
-def build_schedule_pdf(swimmer_name: str, matched: List[dict]) -> str:
-    tmp = tempfile.NamedTemporaryFile(delete=False, suffix=".pdf")
-    tmp_path = tmp.name
-    tmp.close()
+def _schedule_row(ev: dict) -> list:
+    evt_text = f"#{ev['event_number']} – {ev['event_name']}"
+    total_heats = ev.get("total_heats")
+    if total_heats:
+        heat_display = f"{ev['heat']} of {total_heats}"
+    else:
+        heat_display = str(ev["heat"])
+    if len(evt_text) > _EVENT_CELL_WRAP_LEN:
+        evt_cell = Paragraph(evt_text, _EV_STYLE)
+    else:
+        evt_cell = evt_text
+    return [
+        evt_cell,
+        heat_display,
+        ev["lane"] if ev["lane"] is not None else "",
+        ev["seed_time"] or "",
+        "Time: __________   Place: ______",
+    ]
 
-    doc = SimpleDocTemplate(
-        tmp_path,
-        pagesize=landscape(letter),
-        leftMargin=30,
-        rightMargin=30,
-        topMargin=30,
-        bottomMargin=30,
-    )
-    elements = []
 
-    title_style = ParagraphStyle("title", fontSize=16, spaceAfter=6, leading=18)
-    sub_style = ParagraphStyle("sub", fontSize=9, spaceAfter=4, textColor=colors.grey)
-    notes_label_style = ParagraphStyle("label", fontSize=9, spaceAfter=2)
+def build_schedule_pdf(swimmer_name: str, matched: List[dict]) -> BytesIO:
+    # Building in memory skips the temp-file write/read round trip (and
+    # the delete=False files the old version left behind).
+    buf = BytesIO()
+    doc = _make_doc(buf)
+    elements = []
 
-    elements.append(Paragraph(f"SwimDay Simplified – {swimmer_name}", title_style))
-    elements.append(Paragraph("Lakeshore Swim Club", sub_style))
+    elements.append(Paragraph(f"SwimDay Simplified – {swimmer_name}", _TITLE_STYLE))
+    elements.append(Paragraph("Lakeshore Swim Club", _SUB_STYLE))
     elements.append(
         Paragraph(
             f"Generated: {datetime.now().strftime('%B %d, %Y %I:%M %p')}",
-            sub_style,
+            _SUB_STYLE,
         )
     )
     elements.append(Spacer(1, 12))
 
     data = [["Event", "Heat", "Lane", "Seed", "Results"]]
     if matched:
-        for ev in matched:
-            evt_text = f"#{ev['event_number']} – {ev['event_name']}"
-            total_heats = ev.get("total_heats")
-            if total_heats:
-                heat_display = f"{ev['heat']} of {total_heats}"
-            else:
-                heat_display = str(ev["heat"])
-            data.append(
-                [
-                    Paragraph(evt_text, ParagraphStyle("ev", fontSize=9, leading=11)),
-                    heat_display,
-                    ev["lane"] if ev["lane"] is not None else "",
-                    ev["seed_time"] or "",
-                    "Time: __________   Place: ______",
-                ]
-            )
+        data.extend(_schedule_row(ev) for ev in matched)
     else:
         data.append(["No events found for this swimmer", "", "", "", ""])
 
@@ -402,36 +627,20 @@ def build_schedule_pdf(swimmer_name: str, matched: List[dict]) -> str:
         data,
         colWidths=[240, 70, 50, 60, 200],
     )
-    table.setStyle(
-        TableStyle(
-            [
-                ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#007bff")),
-                ("TEXTCOLOR", (0, 0), (-1, 0), colors.whitesmoke),
-                ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
-                ("FONTSIZE", (0, 0), (-1, 0), 10),
-                ("ALIGN", (1, 1), (3, -1), "CENTER"),
-                ("VALIGN", (0, 0), (-1, -1), "MIDDLE"),
-                ("GRID", (0, 0), (-1, -1), 0.4, colors.grey),
-                ("ROWBACKGROUNDS", (0, 1), (-1, -1), [colors.whitesmoke, colors.lightgrey]),
-                ("LEFTPADDING", (0, 0), (-1, -1), 4),
-                ("RIGHTPADDING", (0, 0), (-1, -1), 4),
-                ("TOPPADDING", (0, 0), (-1, -1), 4),
-                ("BOTTOMPADDING", (0, 0), (-1, -1), 4),
-            ]
-        )
-    )
+    table.setStyle(_SCHEDULE_TABLE_STYLE)
 
     elements.append(table)
     elements.append(Spacer(1, 14))
-    elements.append(Paragraph("Notes:", notes_label_style))
+    elements.append(Paragraph("Notes:", _LABEL_STYLE))
     elements.append(Spacer(1, 4))
     for _ in range(3):
         elements.append(
-            Paragraph("_______________________________________________________________", sub_style)
+            Paragraph("_______________________________________________________________", _SUB_STYLE)
         )
 
     doc.build(elements)
-    return tmp_path
+    buf.seek(0)
+    return buf
 
 
 def time_to_seconds(t: str) -> float:
@@ -439,32 +648,8 @@ def time_to_seconds(t: str) -> float:
     Convert time strings like "1:05.32" or "47.64" to seconds.
     """
     t = t.strip()
-    if ":" in t:
-        mins, rest = t.split(":", 1)
-        return int(mins) * 60 + float(rest)
+    # find + slice instead of "in" + split: one scan, no list allocation.
+    i = t.find(":")
+    if i >= 0:
+        return int(t[:i]) * 60 + float(t[i + 1:])
     return float(t)
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-
-